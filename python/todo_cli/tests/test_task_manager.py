@@ -6,6 +6,7 @@ from datetime import datetime
 from todo.task import Task, TaskStatus, TaskPriority
 from todo.task_manager import TaskManager
 from todo.storage import Storage
+from todo.time_index import TimeIndex
 
 class TestTaskManagerFunctionalities(unittest.TestCase):
     """Test various functionalities of the TaskManager class."""
@@ -13,8 +14,7 @@ class TestTaskManagerFunctionalities(unittest.TestCase):
     def setUp(self):
         """Set up environment before each test."""
         self.task_manager = TaskManager()
-        self.task_manager.tasks = []
-        self.task_manager.next_id = 1
+        self.task_manager.load([])
 
         # Use a separate test file to avoid touching real data
         self.original_filename = Storage.FILENAME if hasattr(Storage, 'FILENAME') else None
@@ -175,5 +175,80 @@ class TestTaskManagerFunctionalities(unittest.TestCase):
             )
         )
 
+    def test_find_tasks_in_range_rejects_unknown_field(self):
+        """Test that querying an unknown timestamp field raises ValueError."""
+        with self.assertRaises(ValueError):
+            self.task_manager.find_tasks_in_range("due_at")
+
+class TestTimeIndex(unittest.TestCase):
+    """Test the sorted timestamp index used for time-range queries."""
+
+    def setUp(self):
+        """Set up an empty index and a few tasks before each test."""
+        self.index = TimeIndex()
+        self.tasks = [
+            Task(
+                id=task_id,
+                title=f"Task {task_id}",
+                description="Indexed task",
+                responsible="Felipe",
+                status=TaskStatus.IN_PROGRESS,
+                priority=TaskPriority.LOW
+            )
+            for task_id in range(1, 4)
+        ]
+
+    def test_remove_with_equal_timestamps_removes_only_the_given_task(self):
+        """Test that removing one of several tasks sharing a timestamp keeps the others."""
+        timestamp = datetime(2024, 1, 1)
+        for task in self.tasks:
+            self.index.add(task, timestamp)
+
+        self.index.remove(self.tasks[1], timestamp)
+
+        self.assertEqual(self.index.between(), [self.tasks[0], self.tasks[2]])
+
+    def test_remove_missing_task_raises_assertion_error(self):
+        """Test that removing a task that is not indexed signals the drift."""
+        self.index.add(self.tasks[0], datetime(2024, 1, 1))
+
+        with self.assertRaises(AssertionError):
+            self.index.remove(self.tasks[1], datetime(2024, 1, 1))
+
+    def test_between_includes_start_and_excludes_end(self):
+        """Test that between() returns the half-open range [start, end)."""
+        self.index.add(self.tasks[0], datetime(2024, 1, 1))
+        self.index.add(self.tasks[1], datetime(2024, 1, 2))
+        self.index.add(self.tasks[2], datetime(2024, 1, 3))
+
+        self.assertEqual(self.index.between(datetime(2024, 1, 2), datetime(2024, 1, 3)), [self.tasks[1]])
+
+    def test_between_with_open_start_or_end(self):
+        """Test that a None bound leaves that side of the range open."""
+        self.index.add(self.tasks[0], datetime(2024, 1, 1))
+        self.index.add(self.tasks[1], datetime(2024, 1, 2))
+        self.index.add(self.tasks[2], datetime(2024, 1, 3))
+
+        self.assertEqual(self.index.between(end=datetime(2024, 1, 2)), [self.tasks[0]])
+        self.assertEqual(self.index.between(start=datetime(2024, 1, 2)), [self.tasks[1], self.tasks[2]])
+        self.assertEqual(self.index.between(), self.tasks)
+
+    def test_move_to_and_from_none(self):
+        """Test that moving to None unindexes a task and moving from None indexes it."""
+        self.index.move(self.tasks[0], None, datetime(2024, 1, 1))
+        self.assertEqual(self.index.between(), [self.tasks[0]])
+
+        self.index.move(self.tasks[0], datetime(2024, 1, 1), None)
+        self.assertEqual(len(self.index), 0)
+
+    def test_move_reorders_task(self):
+        """Test that moving a task to a later timestamp places it after the others."""
+        self.index.add(self.tasks[0], datetime(2024, 1, 1))
+        self.index.add(self.tasks[1], datetime(2024, 1, 2))
+
+        self.index.move(self.tasks[0], datetime(2024, 1, 1), datetime(2024, 1, 3))
+
+        self.assertEqual(self.index.between(), [self.tasks[1], self.tasks[0]])
+
 if __name__ == "__main__":
     unittest.main()
@@ -2,6 +2,7 @@
 import unittest
 import os
 from unittest.mock import patch
+from datetime import datetime
 from todo.task import Task, TaskStatus, TaskPriority
 from todo.task_manager import TaskManager
 from todo.storage import Storage
@@ -12,8 +13,7 @@ class TestTaskManagerWithMockedInput(unittest.TestCase):
     def setUp(self):
         """Set up environment before each test."""
         self.task_manager = TaskManager()
-        self.task_manager.tasks = []
-        self.task_manager.next_id = 1
+        self.task_manager.load([])
 
         # Use a separate test file to avoid touching real data
         self.original_filename = Storage.FILENAME if hasattr(Storage, 'FILENAME') else None
@@ -49,7 +49,7 @@ class TestTaskManagerWithMockedInput(unittest.TestCase):
             status=TaskStatus.IN_PROGRESS,
             priority=TaskPriority.MEDIUM
         )
-        self.task_manager.tasks.append(task)
+        self.task_manager.load([task])
         self.task_manager.complete_task()
 
         self.assertEqual(task.status, TaskStatus.COMPLETED)
@@ -66,7 +66,7 @@ class TestTaskManagerWithMockedInput(unittest.TestCase):
             status=TaskStatus.IN_PROGRESS,
             priority=TaskPriority.LOW
         )
-        self.task_manager.tasks.append(task)
+        self.task_manager.load([task])
         self.task_manager.cancel_task()
 
         self.assertEqual(task.status, TaskStatus.CANCELLED)
@@ -83,7 +83,7 @@ class TestTaskManagerWithMockedInput(unittest.TestCase):
             status=TaskStatus.IN_PROGRESS,
             priority=TaskPriority.MEDIUM
         )
-        self.task_manager.tasks.append(task)
+        self.task_manager.load([task])
         self.task_manager.edit_task()
 
         self.assertEqual(task.title, "New Title")
@@ -102,10 +102,108 @@ class TestTaskManagerWithMockedInput(unittest.TestCase):
             status=TaskStatus.IN_PROGRESS,
             priority=TaskPriority.LOW
         )
-        self.task_manager.tasks.append(task)
+        self.task_manager.load([task])
         self.task_manager.remove_task()
 
         self.assertEqual(len(self.task_manager.tasks), 0)
 
+    @patch("builtins.input", side_effect=["Indexed Task", "Description", "Felipe", "Low", "1"])
+    def test_complete_task_updates_time_indexes(self, mock_input):
+        """Test that completing a task moves it in the updated_at index and adds it to closed_at."""
+        self.task_manager.add_task()
+        task = self.task_manager.tasks[0]
+        created_at = task.created_at
+
+        self.assertEqual(self.task_manager.find_tasks_in_range("closed_at"), [])
+        self.task_manager.complete_task()
+
+        self.assertEqual(self.task_manager.find_tasks_in_range("created_at", created_at), [task])
+        self.assertEqual(self.task_manager.find_tasks_in_range("updated_at", task.updated_at), [task])
+        self.assertEqual(self.task_manager.find_tasks_in_range("closed_at", task.closed_at), [task])
+        self.assertEqual(len(self.task_manager.time_indexes["updated_at"]), 1)
+
+    @patch("builtins.input", side_effect=["1", "", "", "", ""])
+    def test_edit_task_moves_task_in_updated_at_index(self, mock_input):
+        """Test that editing a task re-indexes it under its new updated_at timestamp."""
+        task = Task(
+            id=1,
+            title="Old Title",
+            description="Old Description",
+            responsible="Felipe",
+            status=TaskStatus.IN_PROGRESS,
+            priority=TaskPriority.MEDIUM,
+            created_at=datetime(2024, 1, 1),
+            updated_at=datetime(2024, 1, 1)
+        )
+        self.task_manager.load([task])
+        self.task_manager.edit_task()
+
+        self.assertEqual(self.task_manager.find_tasks_in_range("updated_at", end=datetime(2024, 1, 2)), [])
+        self.assertEqual(self.task_manager.find_tasks_in_range("updated_at", datetime(2024, 1, 2)), [task])
+        self.assertEqual(self.task_manager.find_tasks_in_range("created_at", end=datetime(2024, 1, 2)), [task])
+
+    @patch("builtins.input", side_effect=["Created", "2024-01-02", "2024-01-03"])
+    def test_list_tasks_by_date_range_using_mocked_input(self, mock_input):
+        """Test that listing by date range only shows tasks inside the inclusive date range."""
+        self.task_manager.load([
+            Task(
+                id=task_id,
+                title=f"Task {task_id}",
+                description="Dated task",
+                responsible="Felipe",
+                status=TaskStatus.IN_PROGRESS,
+                priority=TaskPriority.LOW,
+                created_at=datetime(2024, 1, day, 12),
+                updated_at=datetime(2024, 1, day, 12)
+            )
+            for task_id, day in enumerate([1, 2, 3, 4], start=1)
+        ])
+
+        with patch.object(self.task_manager, "_print_tasks_table") as mock_print:
+            self.task_manager.list_tasks_by_date_range()
+
+        listed = mock_print.call_args.args[0]
+        self.assertEqual([task.id for task in listed], [2, 3])
+
+    @patch("builtins.input", side_effect=["Created", "2024-01-02", "9999-12-31"])
+    def test_list_tasks_by_date_range_accepts_last_representable_day(self, mock_input):
+        """Test that an end date of 9999-12-31 is treated as an open upper bound instead of overflowing."""
+        self.task_manager.load([
+            Task(
+                id=task_id,
+                title=f"Task {task_id}",
+                description="Dated task",
+                responsible="Felipe",
+                status=TaskStatus.IN_PROGRESS,
+                priority=TaskPriority.LOW,
+                created_at=datetime(2024, 1, day, 12),
+                updated_at=datetime(2024, 1, day, 12)
+            )
+            for task_id, day in enumerate([1, 2], start=1)
+        ])
+
+        with patch.object(self.task_manager, "_print_tasks_table") as mock_print:
+            self.task_manager.list_tasks_by_date_range()
+
+        listed = mock_print.call_args.args[0]
+        self.assertEqual([task.id for task in listed], [2])
+
+    @patch("builtins.input", side_effect=["1", "y"])
+    def test_remove_task_drops_task_from_time_indexes(self, mock_input):
+        """Test that removing a task removes it from every time index."""
+        task = Task(
+            id=1,
+            title="Task to Remove",
+            description="Remove me",
+            responsible="Felipe",
+            status=TaskStatus.IN_PROGRESS,
+            priority=TaskPriority.LOW
+        )
+        self.task_manager.load([task])
+        self.task_manager.remove_task()
+
+        for index in self.task_manager.time_indexes.values():
+            self.assertEqual(len(index), 0)
+
 if __name__ == "__main__":
     unittest.main()
@@ -18,16 +18,17 @@ def show_menu():
     print("5. Cancel Task")
     print("6. Edit Task")
     print("7. Remove Task")
-    print("8. Exit")
+    print("8. List Tasks by Date Range")
+    print("9. Exit")
 
     try:
-        option = int(input("Select an option (1-8): "))
+        option = int(input("Select an option (1-9): "))
     except ValueError:
         return False
     finally:
         clear_screen()
 
-    if 1 <= option <= 7:
+    if 1 <= option <= 8:
         if option == 1:
             task_manager.add_task()
         elif option == 2:
@@ -42,8 +43,10 @@ def show_menu():
             task_manager.edit_task()
         elif option == 7:
             task_manager.remove_task()
+        elif option == 8:
+            task_manager.list_tasks_by_date_range()
 
         input("\nPress Enter to continue...")
         clear_screen()
 
-    return option == 8
+    return option == 9
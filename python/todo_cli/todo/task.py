@@ -1,5 +1,5 @@
 """Dataclass and Enums for Task representation in a to-do list application."""
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Optional
 from enum import Enum
 from datetime import datetime
@@ -25,8 +25,8 @@ class Task:
     responsible: str
     status: TaskStatus
     priority: TaskPriority
-    created_at: datetime = datetime.now()
-    updated_at: datetime = datetime.now()
+    created_at: datetime = field(default_factory=datetime.now)
+    updated_at: datetime = field(default_factory=datetime.now)
     closed_at: Optional[datetime] = None
 
     def to_dict(self):
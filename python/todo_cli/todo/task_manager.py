@@ -1,17 +1,38 @@
 """Task Manager Module for the to-do list application."""
 import textwrap
-from datetime import datetime
+from datetime import datetime, timedelta
 from tabulate import tabulate
 from todo.task import Task, TaskPriority, TaskStatus
 from todo.storage import Storage
+from todo.time_index import TimeIndex
+
+TIMESTAMP_FIELDS = ("created_at", "updated_at", "closed_at")
 
 class TaskManager:
     """Class to manage tasks in the to-do list application."""
 
     def __init__(self):
         """Initializes the task manager with an empty task list."""
-        self.tasks = Storage.load_tasks()
+        self.time_indexes = {field: TimeIndex() for field in TIMESTAMP_FIELDS}
+        self.load(Storage.load_tasks())
+
+    def load(self, tasks: list[Task]):
+        """Replaces the task list and rebuilds everything derived from it."""
+        self.tasks = tasks
         self.next_id = 1 if not self.tasks else max(task.id for task in self.tasks) + 1
+        self.reindex()
+
+    def reindex(self):
+        """Rebuilds the timestamp indexes from the current task list."""
+        for field, index in self.time_indexes.items():
+            index.clear()
+            for task in sorted(self.tasks, key=lambda t, f=field: getattr(t, f) or datetime.min):
+                index.add(task, getattr(task, field))
+
+    def _set_timestamp(self, task: Task, field: str, value: datetime | None):
+        """Sets a timestamp field on a task and keeps its index in sync."""
+        self.time_indexes[field].move(task, getattr(task, field), value)
+        setattr(task, field, value)
 
     def _has_tasks(self) -> bool:
         """Checks if there are any tasks in the task list."""
@@ -51,8 +72,8 @@ class TaskManager:
         if task:
             now = datetime.now()
             task.status = status
-            task.updated_at = now
-            task.closed_at = now
+            self._set_timestamp(task, "updated_at", now)
+            self._set_timestamp(task, "closed_at", now)
             Storage.save_tasks(self.tasks)
             print(f"Task '{task.title}' marked as {status.value.lower()}.")
         else:
@@ -84,19 +105,18 @@ class TaskManager:
         )
 
         self.tasks.append(task)
+        for field, index in self.time_indexes.items():
+            index.add(task, getattr(task, field))
         self.next_id += 1
         Storage.save_tasks(self.tasks)
         print(f"Task '{title}' added successfully. ID: {task.id}")
 
-    def list_tasks(self):
-        """Lists all tasks in the task list."""
-        if not self._has_tasks():
-            return
-
+    def _print_tasks_table(self, tasks: list[Task]):
+        """Prints the given tasks as a table."""
         table = []
         headers = ["ID", "Title", "Description", "Responsible", "Status", "Priority", "Created At", "Updated At", "Closed At"]
 
-        for task in self.tasks:
+        for task in tasks:
             table.append([
                 task.id,
                 textwrap.fill(task.title, 20),
@@ -111,6 +131,61 @@ class TaskManager:
 
         print(tabulate(table, headers=headers, tablefmt="grid"))
 
+    def list_tasks(self):
+        """Lists all tasks in the task list."""
+        if not self._has_tasks():
+            return
+
+        self._print_tasks_table(self.tasks)
+
+    def find_tasks_in_range(self, field: str, start: datetime | None = None, end: datetime | None = None) -> list[Task]:
+        """Returns tasks whose timestamp field falls in [start, end), oldest first."""
+        if field not in self.time_indexes:
+            raise ValueError(f"Unknown timestamp field '{field}'. Expected one of: {', '.join(TIMESTAMP_FIELDS)}.")
+
+        return self.time_indexes[field].between(start, end)
+
+    def list_tasks_by_date_range(self):
+        """Lists tasks whose created, updated or closed date falls within a date range."""
+        if not self._has_tasks():
+            return
+
+        fields = {"CREATED": "created_at", "UPDATED": "updated_at", "CLOSED": "closed_at"}
+
+        while True:
+            field_input = input("Filter by date (Created, Updated, Closed): ").strip().upper()
+
+            if field_input in fields:
+                field = fields[field_input]
+                break
+
+            print("Invalid option. Please enter Created, Updated, or Closed.")
+
+        while True:
+            try:
+                start_input = input("Enter start date (YYYY-MM-DD) or leave blank for no limit: ").strip()
+                end_input = input("Enter end date (YYYY-MM-DD) or leave blank for no limit: ").strip()
+                start = datetime.strptime(start_input, "%Y-%m-%d") if start_input else None
+                end = datetime.strptime(end_input, "%Y-%m-%d") if end_input else None
+                break
+            except ValueError:
+                print("Invalid date. Please use the format YYYY-MM-DD.")
+
+        if end is not None:
+            try:
+                end += timedelta(days=1)
+            except OverflowError:
+                # The last representable day has no next day, so leave the range open.
+                end = None
+
+        tasks = self.find_tasks_in_range(field, start, end)
+
+        if not tasks:
+            print("No tasks found in the given date range.")
+            return
+
+        self._print_tasks_table(tasks)
+
     def search_task_by_id(self):
         """Searches for a task by its ID."""
         if not self._has_tasks():
@@ -183,7 +258,7 @@ class TaskManager:
             if new_responsible.strip() != "":
                 task.responsible = new_responsible
 
-            task.updated_at = datetime.now()
+            self._set_timestamp(task, "updated_at", datetime.now())
             Storage.save_tasks(self.tasks)
             print(f"Task '{task.title}' updated successfully.")
         else:
@@ -204,6 +279,8 @@ class TaskManager:
 
             if confirm == 'y':
                 self.tasks.remove(task)
+                for field, index in self.time_indexes.items():
+                    index.remove(task, getattr(task, field))
                 Storage.save_tasks(self.tasks)
                 print(f"Task '{task.title}' removed successfully.")
             else:
@@ -0,0 +1,57 @@
+"""Sorted timestamp index for time-range queries in the to-do list application."""
+from bisect import bisect_left, bisect_right
+from datetime import datetime
+from todo.task import Task
+
+class TimeIndex:
+    """Keeps tasks sorted by a timestamp so ranges can be found with bisect."""
+
+    def __init__(self):
+        """Initializes an empty index."""
+        self._times: list[datetime] = []
+        self._tasks: list[Task] = []
+
+    def __len__(self) -> int:
+        """Returns the number of indexed tasks."""
+        return len(self._times)
+
+    def clear(self):
+        """Removes every entry from the index."""
+        self._times.clear()
+        self._tasks.clear()
+
+    def add(self, task: Task, timestamp: datetime | None):
+        """Adds a task under the given timestamp. None timestamps are not indexed."""
+        if timestamp is None:
+            return
+
+        position = bisect_right(self._times, timestamp)
+        self._times.insert(position, timestamp)
+        self._tasks.insert(position, task)
+
+    def remove(self, task: Task, timestamp: datetime | None):
+        """Removes a task indexed under the given timestamp."""
+        if timestamp is None:
+            return
+
+        start = bisect_left(self._times, timestamp)
+        end = bisect_right(self._times, timestamp, lo=start)
+
+        for position in range(start, end):
+            if self._tasks[position] is task:
+                del self._times[position]
+                del self._tasks[position]
+                return
+
+        raise AssertionError(f"Task {task.id} is not indexed under {timestamp.isoformat()}.")
+
+    def move(self, task: Task, old_timestamp: datetime | None, new_timestamp: datetime | None):
+        """Re-indexes a task whose timestamp changed."""
+        self.remove(task, old_timestamp)
+        self.add(task, new_timestamp)
+
+    def between(self, start: datetime | None = None, end: datetime | None = None) -> list[Task]:
+        """Returns tasks with start <= timestamp < end, oldest first. None leaves a side open."""
+        low = 0 if start is None else bisect_left(self._times, start)
+        high = len(self._times) if end is None else bisect_left(self._times, end)
+        return self._tasks[low:high]